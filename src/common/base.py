@@ -1,27 +1,200 @@
-import json
+import asyncio
+import hashlib
+import itertools
 import os
-import uuid
+import secrets
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import random
-from itertools import permutations
-from ..utils.utils import llm_call
+import orjson
+from openai import AsyncOpenAI
+from ..utils.utils import is_local_url, json_dumps, json_loads, make_async_client, make_client
+from .semcache import semantic_cache
 
 # Use python-dotenv to read .env file
 from dotenv import load_dotenv
-from openai import OpenAI
 import networkx as nx
+import numpy as np
+from numba import njit, prange
 
 load_dotenv()
 api_key = os.getenv("API_KEY")
 base_url = os.getenv("BASE_URL")
-client = OpenAI(api_key=api_key, base_url=base_url)
+# Whether BASE_URL points at a local provider (e.g. Ollama)
+is_local = is_local_url(base_url)
+client = make_client(api_key, base_url)
+
+# Upper bound on in-flight requests issued by BaseConversation.batch_api
+API_CONCURRENCY = 16
+# Delay in seconds between consecutive request launches, to respect rate limits
+API_LAUNCH_DELAY = 0.15
+
+# Parameters of an API request when the caller gives none
+DEFAULT_API_PARAMETERS = {
+    "temperature": 0.7,
+    "max_tokens": 10,
+    "top_p": 1.0,
+}
+
+# Exact-match LRU cache of API responses, keyed by a hash of (model, prompt, parameters)
+EXACT_CACHE_SIZE = 10_000
+_exact_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+def _cache_key(model: str, prompt: str, parameters: dict) -> str:
+    """
+    Compute a stable cache key for an API request.
+
+    :param model: The model used for the request.
+    :param prompt: The text sent to the API.
+    :param parameters: The request parameters.
+    :return: A hex digest identifying the request.
+    """
+    # Like json_dumps, encode values such as httpx.Timeout with str() rather than failing
+    payload = orjson.dumps(
+        [model, prompt, parameters],
+        default=str,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    )
+    return hashlib.blake2b(payload).hexdigest()
+
+
+def _cache_get(key: str):
+    """
+    Look up a cached response and mark it as recently used.
+
+    :param key: The cache key of the request.
+    :return: The cached response, or None on a miss.
+    """
+    response = _exact_cache.get(key)
+    if response is not None:
+        _exact_cache.move_to_end(key)
+    return response
+
+
+def _cache_put(key: str, parameters: dict, response: str):
+    """
+    Store a response, evicting the least recently used entry when full.
+
+    Only deterministic requests, with an explicit temperature of 0, and a non-empty
+    response are cached; providers sample when the temperature is omitted.
+
+    :param key: The cache key of the request.
+    :param parameters: The request parameters.
+    :param response: The text of the API response.
+    """
+    if not response or parameters.get("temperature") != 0:
+        return
+    _exact_cache[key] = response
+    _exact_cache.move_to_end(key)
+    if len(_exact_cache) > EXACT_CACHE_SIZE:
+        _exact_cache.popitem(last=False)
+
+
+def _prepare_call(prompt: str, model: str, parameters: dict = None):
+    """
+    Build a chat completion request and look it up in the exact-match cache.
+
+    Shared by BaseConversation.call_api and BaseConversation.call_api_async.
+
+    :param prompt: The text sent to the API.
+    :param model: The model used for the request.
+    :param parameters: Optional request parameters; defaults to DEFAULT_API_PARAMETERS.
+    :return: The request keyword arguments, the resolved parameters, the cache key, and the
+        cached response (None on a miss).
+    """
+    if parameters is None:
+        parameters = DEFAULT_API_PARAMETERS
+    if is_local:
+        # Streaming only adds chunk parsing overhead without network latency to hide
+        parameters = {**parameters, "stream": False}
+    key = _cache_key(model, prompt, parameters)
+    request = {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        **parameters,
+    }
+    return request, parameters, key, _cache_get(key)
+
+
+def _finish_call(key: str, parameters: dict, response) -> str:
+    """
+    Extract the text of a chat completion and store it in the exact-match cache.
+
+    :param key: The cache key returned by `_prepare_call`.
+    :param parameters: The resolved parameters returned by `_prepare_call`.
+    :param response: The chat completion.
+    :return: The text of the API response.
+    """
+    content = response.choices[0].message.content
+    _cache_put(key, parameters, content)
+    return content
+
+
+@njit(cache=True)
+def _mix64(x):
+    """
+    The splitmix64 finalizer: a bijective scramble of a 64-bit integer.
+
+    :param x: The value to scramble (uint64).
+    :return: The scrambled value (uint64).
+    """
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+@njit(cache=True)
+def _uniform(seed, k):
+    """
+    Counter-based uniform draw in [0, 1), using the splitmix64 mixer.
+
+    Each edge gets its own stream, so draws do not depend on thread scheduling. The seed
+    is scrambled on its own before the index is mixed in, so nearby seeds give unrelated
+    streams rather than the same draws shifted by one edge.
+
+    :param seed: The seed of the sweep (uint64).
+    :param k: The index of the draw.
+    :return: A float in [0, 1).
+    """
+    golden = np.uint64(0x9E3779B97F4A7C15)
+    x = _mix64(seed + golden) ^ (np.uint64(k) * golden)
+    x = _mix64(x + golden)
+    return (x >> np.uint64(11)) * (1.0 / 9007199254740992.0)
+
+
+@njit(parallel=True, cache=True)
+def _sweep_agreement(adj, edges, p, seed):
+    """
+    Reverse each edge independently with probability p, in parallel.
+
+    :param adj: The boolean adjacency matrix, modified in place.
+    :param edges: An (E, 2) array of edge indices with no reverse edge.
+    :param p: The probability that both nodes agree to reverse an edge.
+    :param seed: The seed of the sweep (uint64).
+    :return: The number of reversed edges.
+    """
+    reversed_count = 0
+    for k in prange(edges.shape[0]):
+        if _uniform(seed, k) < p:
+            i = edges[k, 0]
+            j = edges[k, 1]
+            adj[i, j] = False
+            adj[j, i] = True
+            reversed_count += 1
+    return reversed_count
+
 
 class BaseMessage:
     """
     Represents a message in the broadcast system.
     """
 
+    __slots__ = ("sender", "receiver", "message_type", "content",
+                 "contribution_metric", "_ts_raw", "_timestamp")
+
     def __init__(
         self,
         sender: str,
@@ -29,6 +202,7 @@ class BaseMessage:
         message_type: str,
         content: List[Dict[str, str]],
         contribution_metric: float = 0.0,
+        created_at: Optional[float] = None,
     ):
         """
         Initialize a new Message.
@@ -37,42 +211,64 @@ class BaseMessage:
         :param receiver: The ID of the receiver.
         :param message_type: The type of message (e.g., "global_event", "local_event").
         :param content: The content of the message.
+        :param contribution_metric: The importance of the message to the world state.
+        :param created_at: Optional POSIX time of creation, shared by messages sent together. Defaults to now.
         """
         self.sender = sender
         self.receiver = receiver
         self.message_type = message_type
         self.content = content
-        self.timestamp = datetime.now().isoformat()
+        self.contribution_metric = contribution_metric
+        self._ts_raw = time.time() if created_at is None else created_at
+        self._timestamp = None
+
+    @property
+    def timestamp(self) -> str:
+        """
+        The creation time of the message in ISO format, formatted on first access.
+        """
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self._ts_raw).isoformat()
+        return self._timestamp
+
+    def to_dict(self):
+        """
+        Convert the message to a dictionary.
+
+        :return: A dictionary representation of the message.
+        """
+        return {
+            "sender": self.sender,
+            "receiver": self.receiver,
+            "message_type": self.message_type,
+            "content": self.content,
+            "timestamp": self.timestamp,
+        }
 
     def to_json(self):
         """
-        Serialize the message to a JSON string.
+        Serialize the message to a compact JSON string.
 
         :return: A JSON string representing the message.
         """
-        return json.dumps(
-            {
-                "sender": self.sender,
-                "receiver": self.receiver,
-                "message_type": self.message_type,
-                "content": self.content,
-                "timestamp": self.timestamp,
-            },
-            indent=4,
-        )
+        return json_dumps(self.to_dict())
+
+    def pretty(self):
+        """
+        Serialize the message to an indented, human-readable JSON string.
+
+        :return: A JSON string representing the message.
+        """
+        return json_dumps(self.to_dict(), indent=True)
 
     @classmethod
-    def from_json(cls, json_str: str):
+    def from_dict(cls, data: Dict[str, Any]):
         """
-        Deserialize a JSON string into a Message object.
+        Create a Message object from a dictionary.
 
-        :param json_str: A JSON string representing the message.
+        :param data: A dictionary representing the message.
         :return: A Message object.
         """
-        if isinstance(json_str, str):
-            data = json.loads(json_str)
-        else:
-            data = json_str
         return cls(
             sender=data["sender"],
             receiver=data["receiver"],
@@ -80,6 +276,20 @@ class BaseMessage:
             content=data["content"],
         )
 
+    @classmethod
+    def from_json(cls, json_str: str):
+        """
+        Deserialize a JSON string into a Message object.
+
+        :param json_str: A JSON string (or an already parsed dictionary) representing the message.
+        :return: A Message object.
+        """
+        if isinstance(json_str, str):
+            data = json_loads(json_str)
+        else:
+            data = json_str
+        return cls.from_dict(data)
+
     def __repr__(self):
         """
         Return a string representation of the message.
@@ -96,32 +306,73 @@ class BaseConversation:
     Represents a conversation owned by a single agent.
     """
 
-    def __init__(self, owner_id: str, conversation_id: str, messages: List[BaseMessage]):
+    __slots__ = ("conversation_id", "messages", "owner", "_static_prefix")
+
+    def __init__(
+        self,
+        owner_id: str,
+        conversation_id: str,
+        messages: List[BaseMessage],
+        system_instructions: str = "",
+        motifs: List[str] = None,
+    ):
         """
         Initialize a new Conversation.
 
+        :param owner_id: The ID of the agent owning the conversation.
         :param conversation_id: The ID of the conversation.
         :param messages: A list of messages in the conversation.
+        :param system_instructions: Optional system instructions sent with every API request.
+        :param motifs: Optional narrative motifs sent with every API request.
         """
         self.conversation_id = conversation_id
         self.messages = messages
         self.owner = str(owner_id)
+        # Built once so that every request starts with a byte-identical prefix,
+        # which lets the provider reuse its prompt cache
+        self._static_prefix = self._build_static_prefix(
+            system_instructions, motifs)
+
+    def _build_static_prefix(self, system_instructions: str, motifs: List[str]) -> str:
+        """
+        Build the static part of the prompt, shared by every request of the conversation.
+
+        :param system_instructions: The system instructions.
+        :param motifs: The narrative motifs.
+        :return: The static prompt prefix.
+        """
+        parts = [system_instructions] if system_instructions else []
+        parts.append(f"Owner: {self.owner}")
+        if motifs:
+            parts.append("Motifs: " + json_dumps(list(motifs)))
+        return "\n\n".join(parts)
+
+    def to_dict(self):
+        """
+        Convert the conversation to a dictionary.
+
+        :return: A dictionary representation of the conversation.
+        """
+        return {
+            "conversation_id": self.conversation_id,
+            "messages": [message.to_dict() for message in self.messages],
+        }
 
     def to_json(self):
         """
-        Serialize the conversation to a JSON string.
+        Serialize the conversation to a compact JSON string.
 
         :return: A JSON string representing the conversation.
         """
-        return json.dumps(
-            {
-                "conversation_id": self.conversation_id,
-                "messages": [
-                    json.loads(message.to_json()) for message in self.messages
-                ],
-            },
-            indent=4,
-        )
+        return json_dumps(self.to_dict())
+
+    def pretty(self):
+        """
+        Serialize the conversation to an indented, human-readable JSON string.
+
+        :return: A JSON string representing the conversation.
+        """
+        return json_dumps(self.to_dict(), indent=True)
 
     @classmethod
     def from_json(cls, json_str: str):
@@ -131,8 +382,8 @@ class BaseConversation:
         :param json_str: A JSON string representing the conversation.
         :return: A Conversation object.
         """
-        data = json.loads(json_str)
-        messages = [BaseMessage.from_json(message)
+        data = json_loads(json_str)
+        messages = [BaseMessage.from_dict(message)
                     for message in data["messages"]]
         return cls(conversation_id=data["conversation_id"], messages=messages)
 
@@ -152,24 +403,81 @@ class BaseConversation:
         :param parameters: Optional, includes parameters such as temperature, max tokens, top_p, etc.
         :return: The text of the API response.
         """
-        if parameters is None:
-            parameters = {
-                "temperature": 0.7,
-                "max_tokens": 10,
-                "top_p": 1.0,
-            }
+        request, parameters, key, cached = _prepare_call(prompt, model, parameters)
+        if cached is not None:
+            return cached
 
         try:
-            response = client.chat.completions.create(
-                model,
-                messages=[{"role": "user", "content": prompt}],
-                **parameters
-            )
-            return response.choices[0].message["content"]
+            response = client.chat.completions.create(**request)
+            return _finish_call(key, parameters, response)
         except Exception as e:
             print(f"Error calling API: {e}")
             return ""
 
+    async def call_api_async(
+        self,
+        prompt: str,
+        model="deepseek-chat",
+        parameters: dict = None,
+        async_client: AsyncOpenAI = None,
+    ) -> str:
+        """
+        Asynchronously calls the API and returns the system's response.
+
+        :param prompt: The text sent to the API.
+        :param parameters: Optional, includes parameters such as temperature, max tokens, top_p, etc.
+        :param async_client: Optional client opened on the running event loop, e.g. by batch_api.
+            Defaults to a client created and closed for this call.
+        :return: The text of the API response.
+        """
+        request, parameters, key, cached = _prepare_call(prompt, model, parameters)
+        if cached is not None:
+            return cached
+
+        try:
+            if async_client is None:
+                async with make_async_client(api_key, base_url) as async_client:
+                    response = await async_client.chat.completions.create(**request)
+            else:
+                response = await async_client.chat.completions.create(**request)
+            return _finish_call(key, parameters, response)
+        except Exception as e:
+            print(f"Error calling API: {e}")
+            return ""
+
+    async def batch_api(
+        self,
+        prompts: List[str],
+        model="deepseek-chat",
+        parameters: dict = None,
+        concurrency: int = API_CONCURRENCY,
+        delay: float = API_LAUNCH_DELAY,
+    ) -> List[str]:
+        """
+        Calls the API for many prompts concurrently, bounded by a semaphore.
+
+        Launches are staggered by `delay` seconds to respect provider rate limits. The
+        requests share one connection pool, opened on the running event loop and closed
+        when the batch is done, so consecutive `asyncio.run` batches each get their own.
+
+        :param prompts: The texts sent to the API.
+        :param parameters: Optional, includes parameters such as temperature, max tokens, top_p, etc.
+        :param concurrency: The maximum number of requests in flight at once.
+        :param delay: The delay in seconds between consecutive request launches.
+        :return: The texts of the API responses, in the same order as `prompts`.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async with make_async_client(api_key, base_url) as async_client:
+            async def _bounded(index: int, prompt: str) -> str:
+                await asyncio.sleep(index * delay)
+                async with semaphore:
+                    return await self.call_api_async(prompt, model, parameters, async_client)
+
+            return await asyncio.gather(
+                *[_bounded(index, prompt) for index, prompt in enumerate(prompts)]
+            )
+
     def add_api_message(self, message: BaseMessage):
         """
         Sends a user message and generates a system response using the DeepSeek API.
@@ -178,11 +486,39 @@ class BaseConversation:
         """
         self.messages.append(message)
 
-        # Generate the prompt for the API request
-        api_prompt = json.dumps(message.content, default=str)
-
-        # Call the API using llm_call
-        system_response = llm_call(api_prompt)
+        # Generate the prompt for the API request: the static prefix goes first, marked
+        # as a cache breakpoint, and the dynamic message content last
+        system_prompt = [
+            {
+                "type": "text",
+                "text": self._static_prefix,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        api_prompt = json_dumps(message.content)
+
+        # Reuse the response of a semantically similar prompt, else call the API
+        system_response, vector = semantic_cache.lookup(
+            api_prompt, namespace=self._static_prefix)
+        if system_response is None:
+            try:
+                response = client.chat.completions.create(
+                    model="deepseek-chat",
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": api_prompt},
+                    ],
+                    temperature=0.7,
+                    max_tokens=4096,
+                    top_p=1.0,
+                )
+                system_response = response.choices[0].message.content
+            except Exception as e:
+                print(f"Error calling API: {e}")
+                system_response = ""
+            if system_response:
+                semantic_cache.add(vector, api_prompt, system_response,
+                                   namespace=self._static_prefix)
 
         # Generate and add the system response
         if system_response:
@@ -204,24 +540,39 @@ class BaseConversation:
         )
 
 
+# Source of sequential agent IDs
+_agent_counter = itertools.count()
+
+
 class BaseAgent:
     """
     A base class for all agents in the system.
     """
 
+    __slots__ = ("agent_id",)
+
     def __init__(self):
         """
         Initialize a new BaseAgent with a unique identifier.
         """
-        self.agent_id = str(uuid.uuid4())  # Generate a unique ID for the agent
+        # Generate a sequential ID for the agent, unique within the process
+        self.agent_id = f"a{next(_agent_counter):012x}"
 
     def to_json(self) -> str:
         """
-        Convert the agent's state to a JSON string.
+        Convert the agent's state to a compact JSON string.
+
+        :return: A JSON string representing the agent's state.
+        """
+        return json_dumps({"agent_id": self.agent_id})
+
+    def pretty(self) -> str:
+        """
+        Convert the agent's state to an indented, human-readable JSON string.
 
         :return: A JSON string representing the agent's state.
         """
-        return json.dumps({"agent_id": self.agent_id}, indent=4)
+        return json_dumps({"agent_id": self.agent_id}, indent=True)
 
     def interact_with_deepseek(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -244,45 +595,161 @@ class BaseAgent:
         return f"BaseAgent(agent_id={self.agent_id})"
 
 
+# Below this many agents, generating the network in pure Python beats NumPy
+SMALL_NETWORK_SIZE = 16
+
+
 class BaseNetwork:
     def __init__(self, agent_ids, p=0.5):
         """
-        Initialize a random directed network using NetworkX.
+        Initialize a random directed network backed by a dense adjacency matrix.
 
         Args:
             agent_ids (list): List of agent IDs.
             p (float, optional): Probability of generating a directed edge. Defaults to 0.5.
         """
-        self.agent_ids = agent_ids
+        self.agent_ids = list(agent_ids)
         self.p = p
-        self.graph = nx.DiGraph()
-        self.graph.add_nodes_from(agent_ids)
+        self.id_to_idx = {agent_id: i for i, agent_id in enumerate(self.agent_ids)}
+        # adj[i, j] is True when there is an edge from agent_ids[i] to agent_ids[j]
+        self.adj = np.zeros((len(self.agent_ids), len(self.agent_ids)), dtype=bool)
+        self._graph = None
         self.generate_random_digraph()
-        # Generate a UUID and store it as a string
-        self.uuid = str(uuid.uuid4())
+        # Generate a random 128-bit ID and store it as a hex string
+        self.uuid = secrets.token_hex(16)
+
+    @property
+    def graph(self):
+        """
+        A NetworkX view of the network, built lazily for external graph algorithms.
+
+        The view is rebuilt after the network changes; edits made to it are not
+        written back to the network.
+
+        Returns:
+            nx.DiGraph: The directed graph.
+        """
+        if self._graph is None:
+            graph = nx.DiGraph()
+            graph.add_nodes_from(self.agent_ids)
+            graph.add_edges_from(self.edges())
+            self._graph = graph
+        return self._graph
 
     def generate_random_digraph(self):
         """
         Generate a random directed graph with the specified edge probability, ensuring no bidirectional edges.
         """
-        for start, end in permutations(self.agent_ids, 2):
-            if self.graph.has_edge(end, start):
-                continue  # Skip if the reverse edge already exists
-            if random.random() <= self.p:
-                self.graph.add_edge(start, end)
+        n = len(self.agent_ids)
+        if n < SMALL_NETWORK_SIZE:
+            self._generate_small_digraph()
+            return
+        # Draw every candidate edge at once, without self-loops
+        mask = np.random.random((n, n)) <= self.p
+        np.fill_diagonal(mask, False)
+        # Where both directions were drawn, keep one of them by coin flip
+        both = mask & mask.T
+        coin = np.triu(np.random.random((n, n)) < 0.5, 1)
+        coin |= coin.T
+        mask &= ~(np.tril(both & coin, -1) | np.triu(both & ~coin, 1))
+        # Skip candidates whose reverse edge already exists
+        mask &= ~self.adj.T
+        self.adj |= mask
+        self._graph = None
+
+    def _generate_small_digraph(self):
+        """
+        Generate the random directed graph pair by pair, which is faster than NumPy for small networks.
+
+        Each unordered pair is visited once and both directions are decided together,
+        with the same edge distribution as generate_random_digraph.
+        """
+        n = len(self.agent_ids)
+        p = self.p
+        rnd = random.random
+        existing = self.adj.tolist()
+        rows, cols = [], []
+        for i in range(n):
+            for j in range(i + 1, n):
+                # Skip candidates whose reverse edge already exists
+                forward = rnd() <= p and not existing[j][i]
+                backward = rnd() <= p and not existing[i][j]
+                if forward and backward:
+                    # Both directions were drawn: keep one of them by coin flip
+                    forward = rnd() < 0.5
+                    backward = not forward
+                if forward:
+                    rows.append(i)
+                    cols.append(j)
+                elif backward:
+                    rows.append(j)
+                    cols.append(i)
+        self.adj[rows, cols] = True
+        self._graph = None
+
+    def has_edge(self, start, end):
+        """
+        Check whether there is an edge between two nodes.
+
+        Args:
+            start: The starting node ID.
+            end: The ending node ID.
+
+        Returns:
+            bool: True if the edge exists, False otherwise.
+        """
+        return bool(self.adj[self.id_to_idx[start], self.id_to_idx[end]])
+
+    def successors(self, node):
+        """
+        Get the nodes that a node has an edge to.
+
+        Args:
+            node: The node ID.
+
+        Returns:
+            list: The IDs of the successor nodes.
+        """
+        return [self.agent_ids[j] for j in np.flatnonzero(self.adj[self.id_to_idx[node]])]
+
+    def edges(self):
+        """
+        Get all edges of the network.
+
+        Returns:
+            list: (start, end) tuples of node IDs.
+        """
+        return [(self.agent_ids[i], self.agent_ids[j]) for i, j in np.argwhere(self.adj)]
+
+    def to_dict(self):
+        """
+        Convert the directed graph to a dictionary.
+
+        Returns:
+            dict: Node IDs as keys and lists of successors as values.
+        """
+        return {
+            str(node): [self.agent_ids[j] for j in np.flatnonzero(self.adj[i])]
+            for i, node in enumerate(self.agent_ids)
+        }
 
     def to_json(self):
         """
-        Convert the directed graph to a JSON-formatted string.
+        Convert the directed graph to a compact JSON-formatted string.
 
         Returns:
             str: JSON representation of the directed graph.
         """
-        # Convert the graph to a dictionary with node IDs as keys and neighbors as values
-        graph_dict = {
-            str(node): list(self.graph.successors(node)) for node in self.graph.nodes
-        }
-        return json.dumps(graph_dict, indent=4)
+        return json_dumps(self.to_dict())
+
+    def pretty(self):
+        """
+        Convert the directed graph to an indented, human-readable JSON string.
+
+        Returns:
+            str: JSON representation of the directed graph.
+        """
+        return json_dumps(self.to_dict(), indent=True)
 
     def __repr__(self):
         """
@@ -301,8 +768,8 @@ class BaseNetwork:
             start: The starting node ID.
             end: The ending node ID.
         """
-        if self.graph.has_edge(start, end):
-            self.graph.remove_edge(start, end)
+        self.adj[self.id_to_idx[start], self.id_to_idx[end]] = False
+        self._graph = None
 
     def connect_edge(self, start, end):
         """
@@ -312,8 +779,8 @@ class BaseNetwork:
             start: The starting node ID.
             end: The ending node ID.
         """
-        if not self.graph.has_edge(start, end):
-            self.graph.add_edge(start, end)
+        self.adj[self.id_to_idx[start], self.id_to_idx[end]] = True
+        self._graph = None
 
     def reverse_edge(self, start, end):
         """
@@ -323,9 +790,16 @@ class BaseNetwork:
             start: The starting node ID.
             end: The ending node ID.
 
+        Returns:
+            bool: True if the edge has been reversed, False if there is no edge from start to end.
         """
-        self.graph.remove_edge(start, end)
-        self.graph.add_edge(end, start)
+        i, j = self.id_to_idx[start], self.id_to_idx[end]
+        if not self.adj[i, j]:
+            return False
+        self.adj[i, j] = False
+        self.adj[j, i] = True
+        self._graph = None
+        return True
 
     def agreement(self, start, end):
         """
@@ -341,6 +815,30 @@ class BaseNetwork:
         # For simplicity, assume both nodes agree 50% of the time
         return random.random() < 0.5
 
+    def sweep_agreement(self, p=0.5, seed=None):
+        """
+        Run one agreement round over every edge: each edge is reversed with probability p.
+
+        Equivalent to calling execute(start, end, agreement, "reverse") on every edge, but
+        compiled with Numba and run in parallel. Pairs connected in both directions are
+        skipped, since the outcome would depend on which direction is reversed first.
+
+        Args:
+            p (float, optional): Probability that both nodes agree to reverse an edge. Defaults to 0.5.
+            seed (int, optional): Seed for reproducible sweeps. Defaults to a random seed.
+
+        Returns:
+            int: The number of reversed edges.
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
+        edges = np.argwhere(self.adj & ~self.adj.T)
+        # Any int is accepted as a seed, e.g. -1; keep its low 64 bits
+        seed = np.uint64(seed & 0xFFFFFFFFFFFFFFFF)
+        reversed_count = _sweep_agreement(self.adj, edges, p, seed)
+        self._graph = None
+        return reversed_count
+
     def execute(self, start, end, method, action):
         """
         Execute an action (reverse, disconnect, or connect) based on the result of the method.
@@ -371,15 +869,46 @@ class BaseNetwork:
 class MessageManager:
     def __init__(self):
         self._messages = []
+        # Contribution metrics in a contiguous column parallel to _messages, grown
+        # geometrically. The column is read when a message is added and then only
+        # written by update_metric, so metrics must be changed through the manager.
+        self._metrics = np.empty(16, dtype=np.float64)
+        # Column positions of each message by id, a message may be added more than once
+        self._positions = {}
 
     def add_message(self, message):
+        n = len(self._messages)
+        if n == len(self._metrics):
+            self._metrics = np.concatenate([self._metrics, np.empty(n)])
+        self._metrics[n] = getattr(message, "contribution_metric", 0)
+        self._positions.setdefault(id(message), []).append(n)
         self._messages.append(message)
 
     def get_messages(self):
         return list(self._messages)
 
+    def get_metrics(self):
+        """
+        Get the contribution metrics of all messages, in insertion order.
+
+        :return: A float64 NumPy array.
+        """
+        return self._metrics[:len(self._messages)].copy()
+
+    def update_metric(self, message, metric):
+        """
+        Update the contribution_metric of a managed message.
+
+        :param message: A message previously added to the manager.
+        :param metric: The new contribution metric.
+        """
+        message.contribution_metric = metric
+        self._metrics[self._positions[id(message)]] = metric
+
     def filter_by_metric(self, threshold=0.5):
-        return [m for m in self._messages if getattr(m, "contribution_metric", 0) >= threshold]
+        metrics = self._metrics[:len(self._messages)]
+        return [self._messages[i] for i in np.flatnonzero(metrics >= threshold)]
 
     def clear_messages(self):
         self._messages.clear()
+        self._positions.clear()
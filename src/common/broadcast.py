@@ -1,6 +1,6 @@
-import json
 from typing import Any, Dict, List
 from base import BaseNetwork, BaseMessage
+from ..utils.utils import json_dumps, json_loads
 
 
 class Broadcast:
@@ -18,19 +18,32 @@ class Broadcast:
         self.messages = messagesList
         self.networkList = networkList
 
+    def to_dict(self):
+        """
+        Convert the broadcast to a dictionary.
+
+        :return: A dictionary representation of the broadcast.
+        """
+        return {
+            "messages": [message.to_dict() for message in self.messages],
+            "networkList": [network.to_dict() for network in self.networkList]
+        }
+
     def to_json(self):
         """
-        Serialize the broadcast to a JSON string.
+        Serialize the broadcast to a compact JSON string.
 
         :return: A JSON string representing the broadcast.
         """
-        return json.dumps(
-            {
-                "messages": [message.to_dict() for message in self.messages],
-                "networkList": [network.to_dict() for network in self.networkList]
-            },
-            indent=4
-        )
+        return json_dumps(self.to_dict())
+
+    def pretty(self):
+        """
+        Serialize the broadcast to an indented, human-readable JSON string.
+
+        :return: A JSON string representing the broadcast.
+        """
+        return json_dumps(self.to_dict(), indent=True)
 
     def __repr__(self):
         """
@@ -45,7 +58,7 @@ class Broadcast:
                 :param json_str: A JSON string representing the broadcast.
                 :return: A Broadcast object.
                 """
-        data = json.loads(json_str)
+        data = json_loads(json_str)
         return cls(
             messagesList=[BaseMessage.from_dict(
                 message) for message in data["messages"]],
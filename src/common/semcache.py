@@ -0,0 +1,142 @@
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from dotenv import load_dotenv
+
+load_dotenv()
+# Minimum cosine similarity for a cached response to be reused
+SEMCACHE_THRESHOLD = float(os.getenv("SEMCACHE_THRESHOLD", "0.92"))
+SEMCACHE_MODEL = os.getenv("SEMCACHE_MODEL", "all-MiniLM-L6-v2")
+# Maximum number of cached responses per namespace; the oldest are evicted first
+SEMCACHE_SIZE = int(os.getenv("SEMCACHE_SIZE", "10000"))
+
+
+class SemanticCache:
+    """
+    Caches LLM responses by prompt embedding, so near-identical prompts reuse a response.
+
+    Entries are grouped by namespace (e.g. the system prompt they were generated under),
+    and a lookup only matches entries of its own namespace.
+
+    The cache is best effort: errors (e.g. the embedding model or FAISS being unavailable)
+    are logged and reported as misses, so callers fall through to the API.
+    """
+
+    def __init__(
+        self,
+        model_name: str = SEMCACHE_MODEL,
+        threshold: float = SEMCACHE_THRESHOLD,
+        max_size: int = SEMCACHE_SIZE,
+    ):
+        """
+        Initialize a new SemanticCache.
+
+        The embedding model and the FAISS indexes are loaded on first use.
+
+        :param model_name: The sentence-transformers model used to embed prompts.
+        :param threshold: The minimum cosine similarity for a cache hit.
+        :param max_size: The maximum number of cached responses per namespace.
+        """
+        self.model_name = model_name
+        self.threshold = threshold
+        self.max_size = max_size
+        self.model = None
+        # Set once the embedding model failed to load, so it is not retried on every call
+        self.disabled = False
+        self.indexes: Dict[str, Any] = {}
+        self.prompts: Dict[str, List[str]] = {}
+        self.responses: Dict[str, List[str]] = {}
+
+    def _load(self):
+        """
+        Load the embedding model.
+        """
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(self.model_name)
+
+    def embed(self, prompt: str):
+        """
+        Embed a prompt as a normalized vector.
+
+        :param prompt: The text to embed.
+        :return: A (1, dim) float32 array.
+        """
+        if self.model is None:
+            self._load()
+        return self.model.encode([prompt], normalize_embeddings=True)
+
+    def lookup(self, prompt: str, namespace: str = "") -> Tuple[Optional[str], Any]:
+        """
+        Find a cached response for a semantically similar prompt.
+
+        :param prompt: The text sent to the API.
+        :param namespace: The namespace to search.
+        :return: The cached response (or None on a miss) and the prompt embedding
+            (None if the prompt could not be embedded).
+        """
+        if self.disabled:
+            return None, None
+        try:
+            if self.model is None:
+                try:
+                    self._load()
+                except Exception:
+                    self.disabled = True
+                    raise
+            vector = self.embed(prompt)
+            index = self.indexes.get(namespace)
+            if index is None or index.ntotal == 0:
+                return None, vector
+            scores, indices = index.search(vector, 1)
+            if scores[0, 0] >= self.threshold:
+                return self.responses[namespace][indices[0, 0]], vector
+            return None, vector
+        except Exception as e:
+            print(f"Error looking up semantic cache: {e}")
+            return None, None
+
+    def add(self, vector, prompt: str, response: str, namespace: str = ""):
+        """
+        Store a response under the embedding of its prompt.
+
+        :param vector: The embedding returned by `lookup`.
+        :param prompt: The text sent to the API.
+        :param response: The text of the API response.
+        :param namespace: The namespace to store the response in.
+        """
+        if vector is None:
+            return
+        try:
+            index = self.indexes.get(namespace)
+            if index is None:
+                import faiss
+
+                index = faiss.IndexFlatIP(vector.shape[1])
+                self.indexes[namespace] = index
+                self.prompts[namespace] = []
+                self.responses[namespace] = []
+            index.add(vector)
+            self.prompts[namespace].append(prompt)
+            self.responses[namespace].append(response)
+            # Evict the oldest entries; removing from a flat index renumbers the rest,
+            # which keeps the ids aligned with the lists
+            excess = index.ntotal - self.max_size
+            if excess > 0:
+                index.remove_ids(np.arange(excess, dtype=np.int64))
+                del self.prompts[namespace][:excess]
+                del self.responses[namespace][:excess]
+        except Exception as e:
+            print(f"Error adding to semantic cache: {e}")
+
+    def clear(self):
+        """
+        Remove all cached responses.
+        """
+        self.indexes.clear()
+        self.prompts.clear()
+        self.responses.clear()
+
+
+semantic_cache = SemanticCache()
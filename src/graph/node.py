@@ -3,8 +3,9 @@ from ..common.broadcast import Broadcast
 from state import WorldState
 import block
 import chain
-import random
-import uuid
+import numpy as np
+import secrets
+import time
 
 
 class Node:
@@ -12,6 +13,9 @@ class Node:
     Represents a node to control the dynamics of the network.
     """
 
+    __slots__ = ("base_network", "broadcast", "chain",
+                 "p", "identity", "node_id", "role")
+
     def __init__(self, base_network: BaseNetwork, p: float, role: str):
         """
         Initialize a new node.
@@ -24,7 +28,7 @@ class Node:
         self.broadcast = Broadcast([], [base_network])
         self.p = p
         self.identity = None
-        self.node_id = str(uuid.uuid4())
+        self.node_id = secrets.token_hex(16)
         self.role = role
 
     def broadcast_messages(self, message: BaseMessage):
@@ -33,25 +37,42 @@ class Node:
 
         Each message is sent with a probability p.
         """
-        for node in self.base_network.graph.nodes():
-            if random.random() < self.p:
-                new_message = BaseMessage(
-                    sender=self.node_id,
-                    receiver=node,
-                    message_type=message.message_type,
-                    content=message.content,
-                    contribution_metric=-1
-                )
-                self.broadcast.messages.append(new_message)
+        # Draw all recipients at once
+        agent_ids = self.base_network.agent_ids
+        selected = np.flatnonzero(np.random.random(len(agent_ids)) < self.p)
+        # Fields shared by every message of the broadcast, including one timestamp
+        sender = self.node_id
+        message_type = message.message_type
+        content = message.content
+        created_at = time.time()
+        self.broadcast.messages.extend(
+            BaseMessage(
+                sender=sender,
+                receiver=agent_ids[i],
+                message_type=message_type,
+                content=content,
+                contribution_metric=-1,
+                created_at=created_at
+            )
+            for i in selected
+        )
 
-    def evaluate_messages(self, state: WorldState):
+    def evaluate_messages(self, state: WorldState, batch: int = 16):
         """
         Evaluate the messages received from all nodes in the network using DeepSeek API.
+
+        Messages are scored in groups of `batch`, one API call per group.
+
+        :param state: The current world state.
+        :param batch: The number of messages scored per API call.
         """
-        for message in self.broadcast.messages:
+        messages = self.broadcast.messages
+        for start in range(0, len(messages), batch):
+            chunk = messages[start:start + batch]
             # Evaluate the contribution_metric using DeepSeek API
-            message.contribution_metric = state.evaluate(
-                message)
+            metrics = state.evaluate_batch(chunk)
+            for message, metric in zip(chunk, metrics):
+                message.contribution_metric = metric
 
     def cherrypick_messages(self):
         """
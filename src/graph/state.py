@@ -4,7 +4,56 @@ from flow import InformationFlow
 from typing import Any, Dict, List
 from uuid import uuid4
 from ..common.base import BaseNetwork, BaseMessage, BaseConversation
-from ..utils.utils import llm_call
+from ..utils.utils import extract_xml, json_dumps, json_dumps_bytes, json_loads, llm_call
+
+
+class _TrackedList(list):
+    """
+    A list counting the edits that rewrite or drop existing entries.
+
+    Appending (append, extend, +=) leaves the existing entries untouched and is not counted,
+    so their serialized form stays valid.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+
+def _rewriting(method):
+    """
+    Wrap a list method so that calling it bumps the version of the list.
+    """
+    def wrapper(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+for _method in ("__setitem__", "__delitem__", "__imul__", "insert", "pop",
+                "remove", "clear", "sort", "reverse"):
+    setattr(_TrackedList, _method, _rewriting(getattr(list, _method)))
+
+
+class _Section:
+    """
+    A list section of WorldState, stored as a _TrackedList so edits are seen by to_json.
+    """
+
+    def __set_name__(self, owner, name):
+        self.attr = "_" + name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return getattr(obj, self.attr)
+
+    def __set__(self, obj, value):
+        setattr(obj, self.attr, value if isinstance(value, _TrackedList) else _TrackedList(value))
 
 
 class WorldState:
@@ -13,6 +62,14 @@ class WorldState:
     agent states, and global narrative motifs.
     """
 
+    # The list sections of the world state, serialized incrementally by to_json
+    _JSON_SECTIONS = ("global_events", "local_events",
+                      "agent_states", "global_motifs")
+    global_events = _Section()
+    local_events = _Section()
+    agent_states = _Section()
+    global_motifs = _Section()
+
     def __init__(
         self,
         agent_list: List[str] = None,
@@ -37,20 +94,76 @@ class WorldState:
         self.local_events = local_events if local_events is not None else []
         self.agent_states = agent_states if agent_states is not None else []
         self.global_motifs = global_motifs if global_motifs is not None else []
+        # Per section: (list, list version, number of serialized entries, encoded chunks)
+        self._json_cache = {}
 
     def to_json(self):
         """
-        Serialize the world state to a JSON string.
+        Serialize the world state to a compact JSON string.
+
+        Only the list entries appended since the previous call are encoded; the encoded
+        chunks are kept and joined once per call. Replacing, removing or reordering entries
+        re-encodes their section, but edits nested inside an entry (e.g. to one event's
+        dictionary) are not seen: call `invalidate_json_cache` after them.
+
+        :return: A JSON string representing the world state.
+        """
+        parts = [b'{"base_network":', json_dumps_bytes(self._base_network_dict())]
+        for name in self._JSON_SECTIONS:
+            parts.append(b',"' + name.encode() + b'":[')
+            parts.extend(self._section_chunks(name))
+            parts.append(b"]")
+        parts.append(b"}")
+        return b"".join(parts).decode()
+
+    def pretty(self):
+        """
+        Serialize the world state to an indented, human-readable JSON string.
 
         :return: A JSON string representing the world state.
         """
-        return json.dumps({
-            "base_network": self.base_network,
+        return json_dumps({
+            "base_network": self._base_network_dict(),
             "global_events": self.global_events,
             "local_events": self.local_events,
             "agent_states": self.agent_states,
             "global_motifs": self.global_motifs
-        }, indent=4)
+        }, indent=True)
+
+    def _section_chunks(self, name: str) -> List[bytes]:
+        """
+        Encode the entries of a list section appended since the last call.
+
+        :param name: The attribute name of the section.
+        :return: The encoded entries in chunks, comma separated, without the brackets.
+        """
+        items = getattr(self, name)
+        cached = self._json_cache.get(name)
+        # Start over if the list was replaced or had existing entries edited
+        if cached is None or cached[0] is not items or cached[1] != items.version:
+            cached = (items, items.version, 0, [])
+        _, version, count, chunks = cached
+        if count < len(items):
+            chunk = json_dumps_bytes(items[count:])[1:-1]
+            chunks.append(b"," + chunk if count else chunk)
+            self._json_cache[name] = (items, version, len(items), chunks)
+        return chunks
+
+    def invalidate_json_cache(self):
+        """
+        Drop the serialized sections, so the next `to_json` call re-encodes everything.
+        """
+        self._json_cache.clear()
+
+    def _base_network_dict(self) -> Dict[str, Any]:
+        """
+        Convert the base network to a JSON-serializable dictionary.
+
+        :return: A dictionary representing the base network.
+        """
+        if isinstance(self.base_network, BaseNetwork):
+            return self.base_network.to_dict()
+        return self.base_network
 
     def evaluate(self, message: BaseMessage, history: str = "") -> float:
         """
@@ -78,6 +191,37 @@ class WorldState:
             print(f"Error evaluating message: {e}")
             return -1  # Default return -1
 
+    def evaluate_batch(self, messages: List[BaseMessage], history: str = "") -> List[float]:
+        """
+        Evaluate the importance of several messages with a single DeepSeek API call.
+
+        :param messages: A list of BaseMessage objects.
+        :param history: The commit history of this node.
+        :return: A list of floats representing the importance of each message (0.0 - 1.0).
+        """
+
+        with open("src/prompts/eval.json", "r", encoding="utf-8") as f:
+            eval_config = json.load(f)
+
+        prompt = eval_config["batch_evaluation_template"]["prompt"].format(
+            contents=json_dumps([message.content for message in messages]),
+            state=self.to_json(),
+            history=history,
+        )
+
+        try:
+            response = llm_call(
+                prompt, parameters=eval_config["parameters"])
+            metrics = json_loads(extract_xml(response, "metrics"))
+            if len(metrics) != len(messages):
+                raise ValueError(
+                    f"Expected {len(messages)} metrics, got {len(metrics)}")
+            # Ensure the return values are between 0.0 and 1.0
+            return [max(0.0, min(1.0, float(metric))) for metric in metrics]
+        except Exception as e:
+            print(f"Error evaluating messages: {e}")
+            return [-1] * len(messages)  # Default return -1
+
     @classmethod
     def from_json(cls, json_str: str):
         """
@@ -86,7 +230,7 @@ class WorldState:
         :param json_str: A JSON string representing the world state.
         :return: A WorldState object.
         """
-        data = json.loads(json_str)
+        data = json_loads(json_str)
         return cls(
             base_network=data.get("base_network", {}),
             global_events=data.get("global_events", []),
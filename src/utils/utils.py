@@ -1,13 +1,137 @@
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+import httpx
+import orjson
 import os
 import re
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
 from dotenv import load_dotenv
-from openai import OpenAI
 
 load_dotenv()
 api_key = os.getenv("API_KEY")
 
-client = OpenAI(api_key=api_key, base_url="https://api.deepseek.com")
+# Pool settings for remote providers: long-lived keep-alive connections, multiplexed over HTTP/2
+REMOTE_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+REMOTE_LIMITS = httpx.Limits(max_connections=128, max_keepalive_connections=64)
+# Pool settings for local providers (e.g. Ollama), served over plain HTTP with no network RTT;
+# local generation can be slow, so wait longer
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "::1"}
+LOCAL_TIMEOUT = httpx.Timeout(300.0)
+LOCAL_LIMITS = httpx.Limits(max_keepalive_connections=64)
+
+
+def is_local_url(base_url: Optional[str]) -> bool:
+    """
+    Checks whether an API base URL points at a local provider.
+
+    Args:
+        base_url (str | None): The API base URL.
+
+    Returns:
+        bool: True if the URL's host is the local machine.
+    """
+    return urlparse(base_url or "").hostname in LOCAL_HOSTS
+
+
+def _pool_settings(api_key: Optional[str], base_url: Optional[str]) -> Tuple[Optional[str], Dict[str, Any]]:
+    """
+    Chooses the API key and HTTP pool settings for an API base URL.
+
+    Local providers get a long timeout over plain HTTP; remote providers get HTTP/2 and
+    larger pools.
+
+    Args:
+        api_key (str | None): The API key. Local providers ignore it, so it may be omitted.
+        base_url (str | None): The API base URL.
+
+    Returns:
+        tuple: The API key and the keyword arguments of the httpx client.
+    """
+    if is_local_url(base_url):
+        return api_key or "ollama", {"http2": False, "timeout": LOCAL_TIMEOUT, "limits": LOCAL_LIMITS}
+    return api_key, {"http2": True, "timeout": REMOTE_TIMEOUT, "limits": REMOTE_LIMITS}
+
+
+def make_client(api_key: Optional[str], base_url: Optional[str]) -> OpenAI:
+    """
+    Builds an OpenAI client with pooled HTTP connections.
+
+    Args:
+        api_key (str | None): The API key. Local providers ignore it, so it may be omitted.
+        base_url (str | None): The API base URL.
+
+    Returns:
+        OpenAI: The client.
+    """
+    api_key, settings = _pool_settings(api_key, base_url)
+    return OpenAI(api_key=api_key, base_url=base_url, http_client=httpx.Client(**settings))
+
+
+def make_async_client(api_key: Optional[str], base_url: Optional[str]) -> AsyncOpenAI:
+    """
+    Builds an AsyncOpenAI client with pooled HTTP connections.
+
+    Pooled connections belong to the event loop that opened them, so the client must not
+    outlive that loop: create one per asyncio.run and close it when done, e.g. with
+    `async with make_async_client(...) as async_client`.
+
+    Args:
+        api_key (str | None): The API key. Local providers ignore it, so it may be omitted.
+        base_url (str | None): The API base URL.
+
+    Returns:
+        AsyncOpenAI: The client.
+    """
+    api_key, settings = _pool_settings(api_key, base_url)
+    return AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=httpx.AsyncClient(**settings))
+
+
+client = make_client(api_key, "https://api.deepseek.com")
+
+
+def json_dumps_bytes(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serializes an object to JSON bytes using orjson.
+
+    Like json.dumps(obj, default=str), non-string dict keys are converted to strings and
+    objects orjson cannot encode natively (e.g. sets) are serialized with str().
+
+    Args:
+        obj (Any): The object to serialize.
+        indent (bool, optional): Whether to indent the output for readability. Defaults to False.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    return orjson.dumps(obj, default=str, option=option)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serializes an object to a JSON string using orjson, see json_dumps_bytes.
+
+    Args:
+        obj (Any): The object to serialize.
+        indent (bool, optional): Whether to indent the output for readability. Defaults to False.
+
+    Returns:
+        str: The JSON string.
+    """
+    return json_dumps_bytes(obj, indent).decode()
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Deserializes a JSON string using orjson.
+
+    Args:
+        data (str | bytes): The JSON document.
+
+    Returns:
+        Any: The deserialized object.
+    """
+    return orjson.loads(data)
 
 
 def write_dotenv(api_key: str, model: str):
@@ -23,13 +147,14 @@ def write_dotenv(api_key: str, model: str):
         f.write(f"MODEL={model}\n")
 
 
-def llm_call(prompt: str, system_prompt: str = "", model="deepseek-chat", parameters: dict = None, role="user") -> str:
+def llm_call(prompt: str, system_prompt: Union[str, List[Dict[str, Any]]] = "", model="deepseek-chat", parameters: dict = None, role="user") -> str:
     """
     Calls the model with the given prompt and returns the response.
 
     Args:
         prompt (str): The user prompt to send to the model.
-        system_prompt (str, optional): The system prompt to send to the model. Defaults to "".
+        system_prompt (str | list, optional): The system prompt to send to the model, either as text
+            or as a list of content blocks (e.g. carrying a cache_control breakpoint). Defaults to "".
         model (str, optional): The model to use for the call.
 
     Returns:
@@ -42,15 +167,15 @@ def llm_call(prompt: str, system_prompt: str = "", model="deepseek-chat", parame
             "top_p": 1.0,
         }
     try:
-        client = OpenAI(api_key=os.environ["API_KEY"])
         messages = [{"role": role, "content": prompt}]
-        response = client.messages.create(
+        if system_prompt:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+        response = client.chat.completions.create(
             model=model,
-            system=system_prompt,
             messages=messages,
             **parameters
         )
-        return response.content[0].text
+        return response.choices[0].message.content
     except Exception as e:
         print(f"Error calling API: {e}")
         return ""
@@ -1,10 +1,27 @@
 # test/unit/test_base_conversation.py
+import asyncio
+import json
 import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+import httpx
+from openai import AsyncOpenAI
+from src.common import base
 from src.common.base import BaseConversation, BaseMessage
 from uuid import uuid4
 
 
 class TestBaseConversation(unittest.TestCase):
+    @staticmethod
+    def _mock_client(content):
+        """
+        Build a mock OpenAI client whose chat completions return `content`.
+        """
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+        return mock_client
+
     def test_conversation_initialization(self):
         """
         Test the initialization of a BaseConversation object.
@@ -198,6 +215,215 @@ class TestBaseConversation(unittest.TestCase):
         # Verify the conversation history
         self.assertEqual(len(conversation.messages), 6)
 
+    def test_batch_api(self):
+        """
+        Test that batched API calls run concurrently, keep prompt order, and survive
+        consecutive event loops.
+        """
+        in_flight = 0
+        peak = 0
+        clients = []
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            prompt = json.loads(request.content)["messages"][0]["content"]
+            return httpx.Response(200, json={
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "deepseek-chat",
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": f"Response to: {prompt}"},
+                    "finish_reason": "stop",
+                }],
+            })
+
+        def make_mock_client(api_key, base_url):
+            mock_client = AsyncOpenAI(
+                api_key="test",
+                base_url="http://localhost/v1",
+                http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            )
+            clients.append(mock_client)
+            return mock_client
+
+        conversation = BaseConversation(
+            owner_id="User", conversation_id=str(uuid4()), messages=[])
+        prompts = [f"prompt {i}" for i in range(8)]
+
+        with patch.object(base, "make_async_client", make_mock_client):
+            for _ in range(2):
+                responses = asyncio.run(
+                    conversation.batch_api(prompts, concurrency=4, delay=0))
+                self.assertEqual(
+                    responses, [f"Response to: {prompt}" for prompt in prompts])
+
+        # Each batch opened its own pool and closed it when done
+        self.assertEqual(len(clients), 2)
+        self.assertTrue(all(mock_client.is_closed() for mock_client in clients))
+        self.assertGreater(peak, 1)
+        self.assertLessEqual(peak, 4)
+
+    def test_call_api_exact_cache(self):
+        """
+        Test that deterministic requests are served from the exact-match cache.
+        """
+        mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content="Paris"))])
+        )
+        conversation = BaseConversation(
+            owner_id="User", conversation_id=str(uuid4()), messages=[])
+        base._exact_cache.clear()
+
+        with patch.object(base, "make_async_client", return_value=mock_client):
+            mock_client.__aenter__.return_value = mock_client
+            # Deterministic requests hit the network once
+            parameters = {"temperature": 0, "max_tokens": 10}
+            for _ in range(2):
+                response = asyncio.run(conversation.call_api_async(
+                    "What's the capital of France?", parameters=parameters))
+                self.assertEqual(response, "Paris")
+            self.assertEqual(mock_client.chat.completions.create.await_count, 1)
+
+            # Sampled requests are never cached
+            parameters = {"temperature": 0.7, "max_tokens": 10}
+            for _ in range(2):
+                asyncio.run(conversation.call_api_async(
+                    "What's the capital of France?", parameters=parameters))
+            self.assertEqual(mock_client.chat.completions.create.await_count, 3)
+
+            # An omitted temperature means the provider samples, so it is not cached either
+            for _ in range(2):
+                asyncio.run(conversation.call_api_async(
+                    "What's the capital of France?", parameters={"max_tokens": 10}))
+            self.assertEqual(mock_client.chat.completions.create.await_count, 5)
+
+    def test_call_api_sync_exact_cache(self):
+        """
+        Test that the synchronous API call works and shares the exact-match cache.
+        """
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="Paris"))])
+        conversation = BaseConversation(
+            owner_id="User", conversation_id=str(uuid4()), messages=[])
+        base._exact_cache.clear()
+
+        with patch.object(base, "client", mock_client):
+            parameters = {"temperature": 0, "max_tokens": 10}
+            for _ in range(2):
+                response = conversation.call_api(
+                    "What's the capital of France?", parameters=parameters)
+                self.assertEqual(response, "Paris")
+
+        mock_client.chat.completions.create.assert_called_once()
+        self.assertEqual(
+            mock_client.chat.completions.create.call_args.kwargs["model"], "deepseek-chat")
+
+    def test_call_api_non_json_parameters(self):
+        """
+        Test that SDK parameters orjson cannot encode, e.g. a timeout, are accepted.
+        """
+        mock_client = self._mock_client("Paris")
+        conversation = BaseConversation(
+            owner_id="User", conversation_id=str(uuid4()), messages=[])
+        base._exact_cache.clear()
+
+        with patch.object(base, "client", mock_client):
+            parameters = {"temperature": 0, "timeout": httpx.Timeout(5.0)}
+            for _ in range(2):
+                response = conversation.call_api(
+                    "What's the capital of France?", parameters=parameters)
+                self.assertEqual(response, "Paris")
+
+        mock_client.chat.completions.create.assert_called_once()
+
+    def test_add_api_message_semantic_cache(self):
+        """
+        Test that a semantic cache hit skips the API call.
+        """
+        conversation = BaseConversation(
+            owner_id="User", conversation_id=str(uuid4()), messages=[])
+        user_message = BaseMessage(
+            sender="User",
+            receiver="DeepSeek",
+            message_type="user_message",
+            content=[{"role": "user", "content": "Tell me a joke."}],
+        )
+
+        with patch.object(base.semantic_cache, "lookup", return_value=("Cached joke", None)), \
+                patch.object(base, "client") as mock_client:
+            conversation.add_api_message(user_message)
+
+        mock_client.chat.completions.create.assert_not_called()
+        self.assertEqual(len(conversation.messages), 2)
+        self.assertEqual(
+            conversation.messages[1].content[0]["text"], "Cached joke")
+
+    def test_add_api_message_static_prefix(self):
+        """
+        Test that every request starts with the same cacheable system prefix.
+        """
+        conversation = BaseConversation(
+            owner_id="User",
+            conversation_id=str(uuid4()),
+            messages=[],
+            system_instructions="You are a storyteller.",
+            motifs=["betrayal", "redemption"],
+        )
+
+        with patch.object(base.semantic_cache, "lookup", return_value=(None, None)), \
+                patch.object(base.semantic_cache, "add"), \
+                patch.object(base, "client", self._mock_client("Once upon a time")) as mock_client:
+            for text in ["Tell me a story.", "Tell me another story."]:
+                conversation.add_api_message(BaseMessage(
+                    sender="User",
+                    receiver="DeepSeek",
+                    message_type="user_message",
+                    content=[{"role": "user", "content": text}],
+                ))
+
+        first_call, second_call = mock_client.chat.completions.create.call_args_list
+        self.assertEqual(first_call.kwargs["model"], "deepseek-chat")
+        first_system, first_user = first_call.kwargs["messages"]
+        second_system, second_user = second_call.kwargs["messages"]
+        self.assertEqual(first_system, second_system)
+        self.assertEqual(first_system["role"], "system")
+        system_block = first_system["content"][0]
+        self.assertEqual(system_block["cache_control"], {"type": "ephemeral"})
+        self.assertTrue(system_block["text"].startswith("You are a storyteller."))
+        self.assertIn("redemption", system_block["text"])
+        self.assertEqual(second_user["role"], "user")
+        self.assertIn("Tell me another story.", second_user["content"])
+        self.assertEqual(conversation.messages[-1].content[0]["text"], "Once upon a time")
+
+    def test_add_api_message_without_semantic_cache(self):
+        """
+        Test that an unavailable semantic cache falls through to the API call.
+        """
+        conversation = BaseConversation(
+            owner_id="User", conversation_id=str(uuid4()), messages=[])
+        user_message = BaseMessage(
+            sender="User",
+            receiver="DeepSeek",
+            message_type="user_message",
+            content=[{"role": "user", "content": "Tell me a joke."}],
+        )
+
+        with patch.object(base.semantic_cache, "disabled", True), \
+                patch.object(base, "client", self._mock_client("A joke")) as mock_client:
+            conversation.add_api_message(user_message)
+
+        mock_client.chat.completions.create.assert_called_once()
+        self.assertEqual(conversation.messages[1].content[0]["text"], "A joke")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -51,6 +51,15 @@ class TestBaseNetwork(unittest.TestCase):
         for start in network_no_edges.graph:
             self.assertEqual(len(network_no_edges.graph[start]), 0)
 
+    def test_regenerate_without_bidirectional_edges(self):
+        """Test that generating edges again never creates bidirectional pairs."""
+        for n in (10, 30):
+            network = BaseNetwork(list(range(n)), p=0.5)
+            for _ in range(3):
+                network.generate_random_digraph()
+            for start, end in network.graph.edges():
+                self.assertFalse(network.graph.has_edge(end, start))
+
     def test_print(self):
         agent_ids = [1, 2, 3, 4, 5]
         network = BaseNetwork(agent_ids)
@@ -86,6 +95,60 @@ class TestBaseNetwork(unittest.TestCase):
             self.assertTrue(self.network.graph.has_edge(1, 2))
             self.assertFalse(self.network.graph.has_edge(2, 1))
 
+    def test_adjacency_accessors(self):
+        """Test edge queries and serialization on the adjacency matrix."""
+        network = BaseNetwork(self.agent_ids, p=0.0)
+        network.connect_edge(1, 2)
+        network.connect_edge(1, 3)
+        self.assertTrue(network.has_edge(1, 2))
+        self.assertFalse(network.has_edge(2, 1))
+        self.assertEqual(network.successors(1), [2, 3])
+        self.assertEqual(network.to_dict(), {"1": [2, 3], "2": [], "3": []})
+        # The NetworkX view follows the adjacency matrix
+        self.assertCountEqual(network.graph.edges(), [(1, 2), (1, 3)])
+        network.reverse_edge(1, 3)
+        self.assertCountEqual(network.graph.edges(), [(1, 2), (3, 1)])
+
+    def test_reverse_missing_edge(self):
+        """Test that reversing a missing edge fails without creating one."""
+        network = BaseNetwork(self.agent_ids, p=0.0)
+        self.assertFalse(network.reverse_edge(1, 2))
+        self.assertFalse(network.execute(
+            1, 2, lambda start, end, action: True, "reverse"))
+        self.assertEqual(list(network.graph.edges()), [])
+
+    def test_sweep_agreement(self):
+        """Test that an agreement sweep reverses edges without creating bidirectional ones."""
+        network = BaseNetwork(list(range(50)), p=0.5)
+        edges_before = network.graph.number_of_edges()
+        # p=0 keeps every edge, p=1 reverses every edge
+        self.assertEqual(network.sweep_agreement(p=0.0), 0)
+        reversed_edges = set((end, start) for start, end in network.graph.edges())
+        self.assertEqual(network.sweep_agreement(p=1.0), edges_before)
+        self.assertEqual(set(network.graph.edges()), reversed_edges)
+        network.sweep_agreement(p=0.5, seed=42)
+        self.assertEqual(network.graph.number_of_edges(), edges_before)
+        for start, end in network.graph.edges():
+            self.assertFalse(network.graph.has_edge(end, start))
+
+    def test_sweep_agreement_seeds(self):
+        """Test that consecutive and negative seeds give independent sweeps."""
+        network = BaseNetwork(list(range(60)), p=0.5)
+        adj = network.adj.copy()
+        outcomes = []
+        for seed in (-1, 0, 1):
+            network.adj[:] = adj
+            network.sweep_agreement(p=0.5, seed=seed)
+            # Which edges of the original network were reversed
+            outcomes.append(~network.adj[adj])
+        # Consecutive seeds must not reuse the same draws shifted by one edge
+        self.assertFalse((outcomes[1][1:] == outcomes[2][:-1]).all())
+        self.assertFalse((outcomes[1] == outcomes[2]).all())
+        # The same seed reproduces the same sweep
+        network.adj[:] = adj
+        network.sweep_agreement(p=0.5, seed=-1)
+        self.assertTrue((~network.adj[adj] == outcomes[0]).all())
+
 
 if __name__ == "__main__":
     unittest.main()
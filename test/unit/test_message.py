@@ -1,3 +1,6 @@
+import json
+import unittest
+from datetime import datetime
 from src.common.base import BaseMessage
 
 # Define system and user prompts
@@ -22,3 +25,45 @@ print("Message:", message)
 # Convert the message to JSON
 json_str = message.to_json()
 print("Message JSON:", json_str)
+
+
+class TestBaseMessage(unittest.TestCase):
+    def test_to_json_matches_to_dict(self):
+        """
+        Test that the generated serializer emits the same document as to_dict.
+        """
+        message = BaseMessage(
+            sender="DM",
+            receiver="ALL",
+            message_type="global_event",
+            content=[{"role": "user", "content": 'A "quoted" dragon — \U0001F409'}],
+        )
+        self.assertEqual(json.loads(message.to_json()), message.to_dict())
+        self.assertEqual(BaseMessage.from_json(message.to_json()).content, message.content)
+
+    def test_to_json_non_json_content(self):
+        """
+        Test that content with non-string keys or non-JSON values still serializes.
+        """
+        message = BaseMessage(
+            sender="DM",
+            receiver="ALL",
+            message_type="global_event",
+            content=[{1: "x", "tags": {"omen"}}],
+        )
+        self.assertEqual(
+            json.loads(message.to_json())["content"], [{"1": "x", "tags": "{'omen'}"}])
+
+    def test_shared_timestamp(self):
+        """
+        Test that messages created together can share one timestamp.
+        """
+        created_at = 1700000000.0
+        messages = [
+            BaseMessage(sender="DM", receiver=receiver, message_type="global_event",
+                        content=[], created_at=created_at)
+            for receiver in ["A", "B"]
+        ]
+        self.assertEqual(messages[0].timestamp, messages[1].timestamp)
+        self.assertEqual(
+            messages[0].timestamp, datetime.fromtimestamp(created_at).isoformat())
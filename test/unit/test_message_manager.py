@@ -0,0 +1,81 @@
+import copy
+import unittest
+from src.common.base import BaseMessage, MessageManager
+
+
+class TestMessageManager(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.manager = MessageManager()
+        self.messages = [
+            BaseMessage(
+                sender="DM",
+                receiver=str(i),
+                message_type="global_event",
+                content=[],
+                contribution_metric=metric,
+            )
+            for i, metric in enumerate([0.9, 0.1, 0.5, 0.7])
+        ]
+        for message in self.messages:
+            self.manager.add_message(message)
+
+    def test_get_messages(self):
+        """Test that messages are returned in insertion order."""
+        self.assertEqual(self.manager.get_messages(), self.messages)
+
+    def test_filter_by_metric(self):
+        """Test that filtering keeps messages at or above the threshold."""
+        self.assertCountEqual(
+            self.manager.filter_by_metric(0.5),
+            [self.messages[0], self.messages[2], self.messages[3]],
+        )
+        self.assertEqual(self.manager.filter_by_metric(0.95), [])
+
+    def test_update_metric(self):
+        """Test that updated metrics are taken into account by filtering."""
+        self.manager.update_metric(self.messages[1], 0.8)
+        self.manager.update_metric(self.messages[0], 0.2)
+        self.assertCountEqual(
+            self.manager.filter_by_metric(0.6),
+            [self.messages[1], self.messages[3]],
+        )
+
+    def test_duplicate_message(self):
+        """Test that a message added twice is updated at both positions."""
+        self.manager.add_message(self.messages[1])
+        self.manager.update_metric(self.messages[1], 0.6)
+        self.assertEqual(list(self.manager.get_metrics()), [0.9, 0.6, 0.5, 0.7, 0.6])
+        self.assertEqual(
+            self.manager.filter_by_metric(0.6),
+            [self.messages[0], self.messages[1], self.messages[3], self.messages[1]],
+        )
+
+    def test_copied_message(self):
+        """Test that a copied message can be updated and added on its own."""
+        copied = copy.copy(self.messages[1])
+        copied.contribution_metric = 0.8
+        self.manager.add_message(copied)
+        self.assertEqual(self.messages[1].contribution_metric, 0.1)
+        self.assertEqual(self.manager.filter_by_metric(0.75), [self.messages[0], copied])
+
+    def test_get_metrics(self):
+        """Test that metrics are returned as one array in insertion order."""
+        for i in range(40):
+            self.manager.add_message(BaseMessage(
+                sender="DM", receiver="ALL", message_type="global_event",
+                content=[], contribution_metric=i / 40))
+        metrics = self.manager.get_metrics()
+        self.assertEqual(len(metrics), 44)
+        self.assertEqual(list(metrics[:4]), [0.9, 0.1, 0.5, 0.7])
+        self.assertEqual(len(self.manager.filter_by_metric(0.5)), 3 + 20)
+
+    def test_clear_messages(self):
+        """Test that clearing removes every message."""
+        self.manager.clear_messages()
+        self.assertEqual(self.manager.get_messages(), [])
+        self.assertEqual(self.manager.filter_by_metric(0.0), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
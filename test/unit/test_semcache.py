@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import patch
+import numpy as np
+from src.common.semcache import SemanticCache
+
+
+class FakeEncoder:
+    """Embeds each distinct prompt as its own unit vector."""
+
+    def __init__(self, dim=64):
+        self.dim = dim
+        self.vocabulary = {}
+
+    def encode(self, prompts, normalize_embeddings=True):
+        vectors = np.zeros((len(prompts), self.dim), dtype=np.float32)
+        for row, prompt in enumerate(prompts):
+            column = self.vocabulary.setdefault(prompt, len(self.vocabulary))
+            vectors[row, column] = 1.0
+        return vectors
+
+
+class TestSemanticCache(unittest.TestCase):
+    def setUp(self):
+        """Set up test fixtures."""
+        self.cache = SemanticCache(threshold=0.9, max_size=3)
+        self.cache.model = FakeEncoder()
+
+    def test_lookup_hit_and_miss(self):
+        """Test that only a similar prompt in the same namespace is a hit."""
+        response, vector = self.cache.lookup("dragon", namespace="a")
+        self.assertIsNone(response)
+        self.cache.add(vector, "dragon", "A dragon story.", namespace="a")
+        self.assertEqual(self.cache.lookup("dragon", namespace="a")[0], "A dragon story.")
+        self.assertIsNone(self.cache.lookup("dragon", namespace="b")[0])
+        self.assertIsNone(self.cache.lookup("knight", namespace="a")[0])
+
+    def test_size_limit(self):
+        """Test that the oldest entries are evicted beyond max_size."""
+        for i in range(5):
+            _, vector = self.cache.lookup(f"prompt {i}")
+            self.cache.add(vector, f"prompt {i}", f"response {i}")
+        self.assertEqual(self.cache.indexes[""].ntotal, 3)
+        self.assertEqual(self.cache.responses[""], ["response 2", "response 3", "response 4"])
+        self.assertIsNone(self.cache.lookup("prompt 0")[0])
+        self.assertEqual(self.cache.lookup("prompt 3")[0], "response 3")
+
+    def test_unavailable_model(self):
+        """Test that a model that cannot be loaded is reported as a miss, once."""
+        cache = SemanticCache()
+        with patch.object(SemanticCache, "_load",
+                          side_effect=ModuleNotFoundError("sentence_transformers")) as mock_load:
+            self.assertEqual(cache.lookup("dragon"), (None, None))
+            self.assertEqual(cache.lookup("dragon"), (None, None))
+            cache.add(None, "dragon", "A dragon story.")
+        self.assertEqual(mock_load.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
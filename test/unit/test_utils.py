@@ -0,0 +1,43 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from src.utils import utils
+
+
+class TestLLMCall(unittest.TestCase):
+    def setUp(self):
+        """Set up a mock client returning a fixed completion."""
+        self.mock_client = MagicMock()
+        self.mock_client.chat.completions.create.return_value = SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="A story"))])
+
+    def test_llm_call(self):
+        """Test that the system prompt is sent as the first chat message."""
+        with patch.object(utils, "client", self.mock_client):
+            response = utils.llm_call("Tell me a story.", "You are a storyteller.")
+
+        self.assertEqual(response, "A story")
+        kwargs = self.mock_client.chat.completions.create.call_args.kwargs
+        self.assertEqual(kwargs["model"], "deepseek-chat")
+        self.assertEqual(kwargs["messages"], [
+            {"role": "system", "content": "You are a storyteller."},
+            {"role": "user", "content": "Tell me a story."},
+        ])
+
+    def test_llm_call_without_system_prompt(self):
+        """Test that an empty system prompt sends only the user message."""
+        with patch.object(utils, "client", self.mock_client):
+            utils.llm_call("Tell me a story.")
+
+        kwargs = self.mock_client.chat.completions.create.call_args.kwargs
+        self.assertEqual(kwargs["messages"], [{"role": "user", "content": "Tell me a story."}])
+
+    def test_llm_call_error(self):
+        """Test that API errors are reported as an empty response."""
+        self.mock_client.chat.completions.create.side_effect = RuntimeError("boom")
+        with patch.object(utils, "client", self.mock_client):
+            self.assertEqual(utils.llm_call("Tell me a story."), "")
+
+
+if __name__ == "__main__":
+    unittest.main()